@@ -1,33 +1,135 @@
 import os, argparse
-import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from time import perf_counter
+
+STATS = {"phases": {}, "counters": {}}
+phase_stack = []
+
+@contextmanager
+def phase(name):
+    now = perf_counter()
+    if phase_stack:
+        parent, started = phase_stack[-1]
+        STATS["phases"][parent] = STATS["phases"].get(parent, 0) + now - started
+    phase_stack.append([name, now])
+    try:
+        yield
+    finally:
+        now = perf_counter()
+        name, started = phase_stack.pop()
+        STATS["phases"][name] = STATS["phases"].get(name, 0) + now - started
+        if phase_stack:
+            phase_stack[-1][1] = now
+
+def add_stat(name, amount=1):
+    STATS["counters"][name] = STATS["counters"].get(name, 0) + amount
+
+def timed(name):
+    from functools import wraps
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with phase(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def peak_rss(children=False):
+    try:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+        return rss if os.uname().sysname == "Darwin" else rss * 1024
+    except ImportError:
+        if children:
+            return None
+        import ctypes
+        from ctypes import wintypes
+        class Counters(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [(name, ctypes.c_size_t) for name in ("PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage", "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage")]
+        counters = Counters(); counters.cb = ctypes.sizeof(counters)
+        ctypes.windll.psapi.GetProcessMemoryInfo(ctypes.windll.kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb)
+        return counters.PeakWorkingSetSize
+
+def write_stats(path, command, elapsed):
+    import json
+    report = {"command": command, "elapsed": round(elapsed, 4), "peak_rss": peak_rss(), "peak_rss_children": peak_rss(children=True),
+              "phases": {name: round(lapsed, 4) for name, lapsed in STATS["phases"].items()}, "counters": STATS["counters"]}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ID_TABLES = None
 
 def get_ids():
+    global ID_TABLES
+    if ID_TABLES is None:
+        ID_TABLES = load_ids()
+    return ID_TABLES
+
+def load_ids():
+    import marshal
+    ids_path = os.path.join(SCRIPT_DIR, "IDs.json")
+    if not os.path.exists(ids_path):
+        ids_path = "IDs.json"
+    stat = os.stat(ids_path)
+    cache_path = os.path.join(SCRIPT_DIR, "__pycache__", "IDs.json.marshal")
+    try:
+        with open(cache_path, "rb") as f:
+            key, characters, subtitleID = marshal.loads(f.read())
+        if key == (os.path.abspath(ids_path), stat.st_mtime_ns, stat.st_size):
+            return characters, subtitleID
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
     import json
-    with open("IDs.json","r",encoding="utf-8") as f:
+    with open(ids_path,"r",encoding="utf-8") as f:
         jsonIds = json.load(f)
-    return jsonIds["characters"], jsonIds["subtitleID"]
+    characters, subtitleID = jsonIds["characters"], jsonIds["subtitleID"]
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path + ".tmp", "wb") as f:
+            marshal.dump(((os.path.abspath(ids_path), stat.st_mtime_ns, stat.st_size), characters, subtitleID), f)
+        os.replace(cache_path + ".tmp", cache_path)
+    except OSError:
+        pass
+    return characters, subtitleID
+
+def iter_texts(xml_path, strip=True):
+    import xml.etree.ElementTree as ET
+    parser = ET.XMLPullParser(events=("start", "end"))
+    stack = []; in_contents = False; contents_done = False
+    with open(xml_path, "r", encoding="utf-8") as f:
+        while True:
+            chunk = f.read(65536)
+            if chunk:
+                parser.feed(chunk)
+            else:
+                parser.close()
+            for event, elem in parser.read_events():
+                if event == "start":
+                    stack.append(elem)
+                    if len(stack) == 2 and elem.tag == "TextContents" and not contents_done:
+                        in_contents = True
+                    continue
+                stack.pop()
+                if len(stack) == 2 and in_contents and elem.tag == "TextContent":
+                    message = elem.findtext("Message", default="")
+                    yield elem.get("ID", ""), elem.get("Unknown2", ""), elem.get("Unknown3", ""), message.strip() if strip else message
+                elif len(stack) == 1 and in_contents:
+                    in_contents = False; contents_done = True
+                if 0 < len(stack) <= 2:
+                    stack[-1].clear()
+            if not chunk:
+                break
 
 def read_texts(xml_path):
     try:
-        with open(xml_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        root = ET.fromstring(content)
-        text_contents = root.find("TextContents")
-        if text_contents is None:
-            return []
-        result = []
-        for text_content in text_contents.findall("TextContent"):
-            content_id = text_content.get("ID", "")
-            message = text_content.findtext("Message", default="").strip()
-            chara_id = text_content.get("Unknown2", "")
-            subtype = text_content.get("Unknown3", "")
-            result.append((content_id, chara_id, subtype, message))
-        return result
+        return list(iter_texts(xml_path))
     except Exception as e:
         print(f" \033[91m[ERROR]\033[00m Error reading {xml_path}: {e}")
         return []
 
 def fix_xml_fields(root):
+    import xml.etree.ElementTree as ET
     text_contents = root.find("TextContents")
     if text_contents is None:
         return
@@ -49,45 +151,162 @@ def fix_xml_fields(root):
             string_elem.text = ""
 
 def write_xml(tree, path):
+    import xml.etree.ElementTree as ET
     root = tree.getroot()
     fix_xml_fields(root)
     xml_body = ET.tostring(root, encoding="unicode", method="xml")
     xml_content = '<?xml version="1.0" encoding="utf-16"?>\r\n' + xml_body
-    with open(path, "w", encoding="utf-8", newline="") as f:
+    with phase("write"), open(path, "w", encoding="utf-8", newline="") as f:
         f.write(xml_content)
+    add_stat("files_written"); add_stat("bytes_written", os.path.getsize(path))
+
+MANIFEST_NAME = "FF16SubsManifest.json"
+
+def load_manifest(root):
+    import json
+    try:
+        with open(os.path.join(root, MANIFEST_NAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f" \033[38;5;214m[WARNING]\033[00m Could not read manifest, rebuilding: {e}")
+        return {}
+
+def save_manifest(root, manifest):
+    import json
+    manifest_path = os.path.join(root, MANIFEST_NAME)
+    with open(manifest_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(manifest_path + ".tmp", manifest_path)
 
-def collect_table(lang_root, jap_root):
-    table_rows = []
+def manifest_key(root, path):
+    return os.path.relpath(path, root).replace(os.sep, "/")
+
+def file_entry(path, entry=None):
+    import hashlib
+    stat = os.stat(path)
+    if entry and entry.get("size") == stat.st_size and entry.get("mtime") == stat.st_mtime_ns:
+        return entry
+    with open(path, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    new_entry = dict(entry or {})
+    new_entry.update(size=stat.st_size, mtime=stat.st_mtime_ns, sha1=digest)
+    return new_entry
+
+def is_stale(source, output, entry, moved=None):
+    if entry is None or "converted" not in entry:
+        return not os.path.exists(output) or os.path.getmtime(output) < os.path.getmtime(source)
+    if entry["sha1"] != entry["converted"] or "output" not in entry:
+        return True
+    for path in (output, moved):
+        try:
+            stat = os.stat(path) if path else None
+        except FileNotFoundError:
+            continue
+        if stat and stat.st_size == entry["output"]["size"] and stat.st_mtime_ns == entry["output"]["mtime"]:
+            return False
+    return True
+
+def mark_converted(entry, output):
+    try:
+        stat = os.stat(output)
+    except FileNotFoundError:
+        return
+    entry["converted"] = entry["sha1"]; entry["output"] = {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+def output_path(source, extension):
+    return str(source) + (".xml" if extension == ".pzd" else "RB.pzd")
+
+def moved_path(output, this_directory, to_directory):
+    name = os.path.basename(output).replace(".pzd.xmlRB.pzd", ".pzd")
+    return os.path.join(to_directory, os.path.dirname(os.path.relpath(output, this_directory)), name)
+
+def read_messages(path):
+    return [text[3] for text in read_texts(path)]
+
+def read_pair(paths):
+    lang_path, jap_path = paths
+    return read_texts(lang_path), read_messages(jap_path)
+
+def walk_pairs(lang_root, jap_root):
+    pairs = []
+    with phase("walk"):
+        for root_dir, _, files in os.walk(lang_root):
+            for file in files:
+                if not file.endswith(".xml"):
+                    continue
+                add_stat("files_walked")
+                lang_path = os.path.join(root_dir, file)
+                rel_path = os.path.relpath(lang_path, lang_root)
+                subdir = os.path.basename(os.path.dirname(rel_path))
+                jap_path = os.path.join(jap_root, rel_path)
+                if not os.path.exists(jap_path):
+                    print(f" \033[38;5;214m[WARNING]\033[00m Japanese path not found: {jap_path}")
+                    continue
+                filename = os.path.splitext(file)[0]
+                if filename.endswith(".pzd"):
+                    filename = filename[:-4]
+                pairs.append((subdir, filename, lang_path, jap_path))
+    return pairs
+
+def read_pairs(paths, jobs=1):
+    if jobs > 1 and len(paths) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            yield from timed_pairs(paths, executor.map(read_pair, paths, chunksize=max(1, len(paths) // (jobs * 4))))
+    else:
+        yield from timed_pairs(paths, map(read_pair, paths))
+
+def timed_pairs(paths, results):
+    for lang_path, jap_path in paths:
+        with phase("parse"):
+            result = next(results)
+        add_stat("files_parsed", 2); add_stat("bytes_read", os.path.getsize(lang_path) + os.path.getsize(jap_path))
+        yield result
+
+def iter_table(lang_root, jap_root, jobs=1):
     characters, subtitleID = get_ids()
-    for root_dir, _, files in os.walk(lang_root):
-        for file in files:
-            if not file.endswith(".xml"):
-                continue
-            lang_path = os.path.join(root_dir, file)
-            rel_path = os.path.relpath(lang_path, lang_root)
-            subdir = os.path.basename(os.path.dirname(rel_path))
-            jap_path = os.path.join(jap_root, rel_path)
-            if not os.path.exists(jap_path):
-                print(f" \033[38;5;214m[WARNING]\033[00m Japanese path not found: {jap_path}")
-                continue
-            lang_data = read_texts(lang_path)
-            jap_data = read_texts(jap_path)
-            filename = os.path.splitext(file)[0]
-            if filename.endswith(".pzd"):
-                filename = filename[:-4]
-            for idx, (id_msg, chara_id, subtype, en_msg) in enumerate(lang_data):
-                jp_msg = jap_data[idx][3] if idx < len(jap_data) else ""
-                chara_name = characters.get(chara_id, "")
-                sub_type = subtitleID.get(subtype, "")
-                table_rows.append((subdir, filename, id_msg, sub_type, chara_name, chara_id, en_msg, jp_msg))
-    return table_rows
+    pairs = walk_pairs(lang_root, jap_root)
+    names = [(subdir, filename) for subdir, filename, _, _ in pairs]
+    results = read_pairs([(lang_path, jap_path) for _, _, lang_path, jap_path in pairs], jobs)
+    yield from table_rows(names, results, characters, subtitleID)
+
+def table_rows(names, results, characters, subtitleID):
+    for (subdir, filename), (lang_data, jap_data) in zip(names, results):
+        for idx, (id_msg, chara_id, subtype, en_msg) in enumerate(lang_data):
+            jp_msg = jap_data[idx] if idx < len(jap_data) else ""
+            chara_name = characters.get(chara_id, "")
+            sub_type = subtitleID.get(subtype, "")
+            yield (subdir, filename, id_msg, sub_type, chara_name, chara_id, en_msg, jp_msg)
+
+def collect_table(lang_root, jap_root, jobs=1):
+    return list(iter_table(lang_root, jap_root, jobs))
+
+SHEET_HEADER = ["Folder", "Filename", "ID", "Sub Type", "Character", "Character ID", "Original Text", "Japanese", "Retranslation"]
+
+def column_widths(header):
+    from openpyxl.utils import get_column_letter
+    widths = {get_column_letter(col): 45 for col in range(7, len(header) - 1)}
+    widths.update({get_column_letter(len(header) - 1): 60, get_column_letter(len(header)): 59, get_column_letter(len(header) + 1): 30})
+    return widths
+
+def sheet_title(subdir):
+    sheet_name = subdir[:31] if len(subdir) <= 31 else subdir[:28] + "..."
+    return sheet_name.replace("/", "_").replace("\\", "_").replace("[", "_").replace("]", "_").replace("*", "_").replace("?", "_").replace(":", "_")
+
+def stats_progress(len_sheets):
+    return [['Subtitle' 'Type','Lines','Translated','Progress'],['Normal',f'SUMPRODUCT(COUNTIF(INDIRECT(A11:A{len_sheets}&B11:B{len_sheets});"Normal"))',f'B5-SUMPRODUCT(COUNTIFS(INDIRECT(A11:A{len_sheets}&B11:B{len_sheets});"Normal";INDIRECT(A11:A{len_sheets}&C11:C{len_sheets});""))','C5/B5'],['SFX',f'SUMPRODUCT(COUNTIF(INDIRECT(A11:A{len_sheets}&B11:B{len_sheets});"SFX"))',f'B6-SUMPRODUCT(COUNTIFS(INDIRECT(A11:A{len_sheets}&B11:B{len_sheets});"SFX";INDIRECT(A11:A{len_sheets}&C11:C{len_sheets});""))','C6/B6'],['Hidden',f'SUMPRODUCT(COUNTIF(INDIRECT(A11:A{len_sheets}&B11:B{len_sheets});"Hidden"))',f'B7-SUMPRODUCT(COUNTIFS(INDIRECT(A11:A{len_sheets}&B11:B{len_sheets});"Hidden";INDIRECT(A11:A{len_sheets}&C11:C{len_sheets});""))','C7/B7'],['TOTAL','SUM(B5:B7)','SUM(C5:C7)','C8/B8']]
 
 # Command: to-xlsx
-def export_xlsx(table_rows, output, verbose):
+@timed("export")
+def export_xlsx(table_rows, output, verbose, header=SHEET_HEADER):
     from openpyxl import Workbook
+    from openpyxl.utils import get_column_letter
     from openpyxl.styles import Font, PatternFill, Alignment
     from collections import Counter, defaultdict
     rows_by_subdir = defaultdict(list); stats = list(); batch_filename = list()
+    widths = column_widths(header); last = get_column_letter(len(header))
     print("> Generating file...")
     try:
         for row in table_rows:
@@ -98,34 +317,35 @@ def export_xlsx(table_rows, output, verbose):
         for subdir, rows in rows_by_subdir.items():
             if verbose:
                 print(f" \033[38;5;75m[INFO]\033[00m Processing: {subdir}")
-            stats.append([subdir,"!D2:D"+ str(len(rows)+1),"!I2:I"+ str(len(rows)+1)])
-            sheet_name = subdir[:31] if len(subdir) <= 31 else subdir[:28] + "..."
-            sheet_name = sheet_name.replace("/", "_").replace("\\", "_").replace("[", "_").replace("]", "_").replace("*", "_").replace("?", "_").replace(":", "_")
-            ws = wb.create_sheet(title=sheet_name)
-            ws.append(["Folder", "Filename", "ID", "Sub Type", "Character", "Character ID", "Original Text", "Japanese", "Retranslation"])
+            stats.append([subdir,"!D2:D"+ str(len(rows)+1),f"!{last}2:{last}"+ str(len(rows)+1)])
+            ws = wb.create_sheet(title=sheet_title(subdir))
+            ws.append(header)
             ws.freeze_panes = "A2"
-            ws.column_dimensions["G"].width = 45; ws.column_dimensions["H"].width = 60; ws.column_dimensions["I"].width = 59; ws.column_dimensions["J"].width = 30
+            for col, width in widths.items():
+                ws.column_dimensions[col].width = width
             ws.sheet_view.zoomScale = 80
-            for subdir_name, filename, msg_id, subtype, chara_name, chara_id, en_text, jp_text in rows:
-                ws.append([subdir_name, filename, msg_id, subtype, chara_name, chara_id, en_text, jp_text, ""])
-                batch_filename.append(filename)
+            for row in rows:
+                ws.append([*row, ""])
+                batch_filename.append(row[1])
             ws.column_dimensions["B"].width = (len(str(ws["B2"].value)) + 0.5) * 1.1207692307692307
             row_filename_len = Counter(batch_filename); start_row = 2
-            for i, count in enumerate(row_filename_len.items()):
-                if i % 2 == 0:
-                    for j in range(start_row, start_row + count[1]):
-                        for col_num in range(1,10):
-                            cell = ws.cell(row=j, column=col_num)
-                            cell.fill = PatternFill(fill_type="solid", start_color="FFF2F2F2")
-                else:
+            with phase("style"):
+                for i, count in enumerate(row_filename_len.items()):
+                    if i % 2 == 0:
+                        for j in range(start_row, start_row + count[1]):
+                            for col_num in range(1, len(header) + 1):
+                                cell = ws.cell(row=j, column=col_num)
+                                cell.fill = PatternFill(fill_type="solid", start_color="FFF2F2F2")
+                        add_stat("cells_styled", count[1] * len(header))
+                    else:
+                        start_row = start_row + count[1]
+                        continue
                     start_row = start_row + count[1]
-                    continue
-                start_row = start_row + count[1]
             batch_filename = list()
         stats_ws["A1"] = "FFXVI Subtitle Translation Progress Sheet"; stats_ws["A1"].font = Font(size="22"); stats_ws.merge_cells("A1:D1")
         stats_ws["A2"] = "Made with FF16SubsOrganizer"; stats_ws["A2"].font = Font(size="10"); stats_ws["A2"].alignment = Alignment(horizontal="right"); stats_ws.merge_cells("A2:D2")
         stats_ws.column_dimensions["A"].width = 12; stats_ws.column_dimensions["C"].width = 10; stats_ws.column_dimensions["D"].width = 50; len_sheets = 9 + len(wb.sheetnames)
-        progress = [['Subtitle' 'Type','Lines','Translated','Progress'],['Normal',f'SUMPRODUCT(COUNTIF(INDIRECT(A11:A{len_sheets}&B11:B{len_sheets});"Normal"))',f'B5-SUMPRODUCT(COUNTIFS(INDIRECT(A11:A{len_sheets}&B11:B{len_sheets});"Normal";INDIRECT(A11:A{len_sheets}&C11:C{len_sheets});""))','C5/B5'],['SFX',f'SUMPRODUCT(COUNTIF(INDIRECT(A11:A{len_sheets}&B11:B{len_sheets});"SFX"))',f'B6-SUMPRODUCT(COUNTIFS(INDIRECT(A11:A{len_sheets}&B11:B{len_sheets});"SFX";INDIRECT(A11:A{len_sheets}&C11:C{len_sheets});""))','C6/B6'],['Hidden',f'SUMPRODUCT(COUNTIF(INDIRECT(A11:A{len_sheets}&B11:B{len_sheets});"Hidden"))',f'B7-SUMPRODUCT(COUNTIFS(INDIRECT(A11:A{len_sheets}&B11:B{len_sheets});"Hidden";INDIRECT(A11:A{len_sheets}&C11:C{len_sheets});""))','C7/B7'],['TOTAL','SUM(B5:B7)','SUM(C5:C7)','C8/B8']]
+        progress = stats_progress(len_sheets)
         stats_ws["A8"].font = stats_ws["B8"].font = stats_ws["C8"].font = stats_ws["D8"].font = Font(bold=True)
         i, j = 4, 11
         for _, row_data in enumerate(progress):
@@ -138,83 +358,381 @@ def export_xlsx(table_rows, output, verbose):
             j += 1
         for row_num in range(11, len_sheets + 1):
             stats_ws.row_dimensions[row_num].hidden = True
-        wb.save(output)
+        with phase("save"):
+            wb.save(output)
+        add_stat("rows_emitted", sum(len(rows) for rows in rows_by_subdir.values())); add_stat("bytes_written", os.path.getsize(output))
         print(f" \033[38;5;76m[DONE]\033[00m XLSX file generated in: \033[48;5;235m{output}\033[00m")
-        print(f" \033[38;5;81m[INSTRUCTION] Edit the 'Retranslation' column (I) on each sheet. Once done, use 'edit-xml' to apply changes.\033[00m")
+        print(f" \033[38;5;81m[INSTRUCTION] Edit the 'Retranslation' column ({last}) on each sheet. Once done, use 'edit-xml' to apply changes.\033[00m")
     except Exception as e:
         print(f" \033[91m[ERROR]\033[00m Couldn't generate file: {e}")
 
-# Command: edit-xml
-def edit_xml(xlsx_path, col_reference, lang_root, verbose):
+@timed("export")
+def export_xlsx_stream(table_rows, output, verbose, header=SHEET_HEADER):
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
+    from openpyxl.styles import Font, PatternFill, Alignment
+    sheets = dict(); stats = list()
+    stripe = PatternFill(fill_type="solid", start_color="FFF2F2F2"); cells_styled = 0
+    widths = column_widths(header); last = get_column_letter(len(header))
+    print("> Generating file...")
+    try:
+        wb = Workbook(write_only=True)
+        stats_ws = wb.create_sheet(title="STATS")
+        for row in table_rows:
+            subdir_name, filename = row[0], row[1]
+            sheet = sheets.get(subdir_name)
+            if sheet is None:
+                if verbose:
+                    print(f" \033[38;5;75m[INFO]\033[00m Processing: {subdir_name}")
+                ws = wb.create_sheet(title=sheet_title(subdir_name))
+                ws.freeze_panes = "A2"
+                for col, width in widths.items():
+                    ws.column_dimensions[col].width = width
+                ws.column_dimensions["B"].width = (len(str(filename)) + 0.5) * 1.1207692307692307
+                ws.sheet_view.zoomScale = 80
+                ws.append(header)
+                sheet = sheets[subdir_name] = [ws, 0, None, -1]
+            ws, rows, last_filename, group = sheet
+            if filename != last_filename:
+                group += 1; sheet[2] = filename; sheet[3] = group
+            values = [*row, ""]
+            if group % 2 == 0:
+                values = [WriteOnlyCell(ws, value) for value in values]
+                for cell in values:
+                    cell.fill = stripe
+                cells_styled += len(header)
+            ws.append(values)
+            sheet[1] = rows + 1
+        for subdir, (ws, rows, _, _) in sheets.items():
+            stats.append([subdir,"!D2:D"+ str(rows+1),f"!{last}2:{last}"+ str(rows+1)])
+        len_sheets = 9 + len(wb.sheetnames)
+        stats_ws.column_dimensions["A"].width = 12; stats_ws.column_dimensions["C"].width = 10; stats_ws.column_dimensions["D"].width = 50
+        for row_num in range(11, len_sheets + 1):
+            stats_ws.row_dimensions[row_num].hidden = True
+        stats_ws.merged_cells.add("A1:D1"); stats_ws.merged_cells.add("A2:D2")
+        title = WriteOnlyCell(stats_ws, "FFXVI Subtitle Translation Progress Sheet"); title.font = Font(size="22")
+        credits = WriteOnlyCell(stats_ws, "Made with FF16SubsOrganizer"); credits.font = Font(size="10"); credits.alignment = Alignment(horizontal="right")
+        stats_ws.append([title]); stats_ws.append([credits]); stats_ws.append([])
+        progress = stats_progress(len_sheets)
+        for row_data in progress[:-1]:
+            stats_ws.append(row_data)
+        total = [WriteOnlyCell(stats_ws, valor) for valor in progress[-1]]
+        for cell in total:
+            cell.font = Font(bold=True)
+        stats_ws.append(total); stats_ws.append([]); stats_ws.append([])
+        for row_data in stats:
+            stats_ws.append(row_data)
+        with phase("save"):
+            wb.save(output)
+        add_stat("rows_emitted", sum(rows for _, rows, _, _ in sheets.values())); add_stat("cells_styled", cells_styled); add_stat("bytes_written", os.path.getsize(output))
+        print(f" \033[38;5;76m[DONE]\033[00m XLSX file generated in: \033[48;5;235m{output}\033[00m")
+        print(f" \033[38;5;81m[INSTRUCTION] Edit the 'Retranslation' column ({last}) on each sheet. Once done, use 'edit-xml' to apply changes.\033[00m")
+    except Exception as e:
+        print(f" \033[91m[ERROR]\033[00m Couldn't generate file: {e}")
+
+def language_tag(lang_root):
+    import re
+    for part in reversed(os.path.abspath(lang_root).split(os.sep)):
+        match = re.match(r"\d+\.([A-Za-z]+)", part)
+        if match:
+            return match.group(1)
+    return os.path.basename(os.path.normpath(lang_root))
+
+def parse_files(function, paths, jobs=1):
+    with phase("parse"):
+        if jobs > 1 and len(paths) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                results = list(executor.map(function, paths, chunksize=max(1, len(paths) // (jobs * 4))))
+        else:
+            results = list(map(function, paths))
+    add_stat("files_parsed", len(paths)); add_stat("bytes_read", sum(os.path.getsize(path) for path in paths))
+    return results
+
+def read_japanese(jap_root, rel_paths, jobs=1):
+    rel_paths = sorted(rel_paths)
+    return dict(zip(rel_paths, parse_files(read_messages, [os.path.join(jap_root, rel_path) for rel_path in rel_paths], jobs)))
+
+def language_results(pairs, jap_index):
+    for _, _, lang_path, rel_path in pairs:
+        with phase("parse"):
+            lang_data = read_texts(lang_path)
+        add_stat("files_parsed"); add_stat("bytes_read", os.path.getsize(lang_path))
+        yield lang_data, jap_index.get(rel_path, [])
+
+def export_language(pairs, jap_index, output, stream, verbose):
+    characters, subtitleID = get_ids()
+    names = [(subdir, filename) for subdir, filename, _, _ in pairs]
+    rows = table_rows(names, language_results(pairs, jap_index), characters, subtitleID)
+    if stream:
+        export_xlsx_stream(rows, output, verbose)
+    else:
+        export_xlsx(list(rows), output, verbose)
+
+def export_language_job(task):
+    STATS["phases"].clear(); STATS["counters"].clear(); phase_stack.clear()
+    export_language(*task)
+    return STATS["counters"]
+
+def combined_rows(pairs, results, others, jap_index, characters, subtitleID):
+    for (subdir, filename, _, rel_path), lang_data in zip(pairs, results):
+        jap_data = jap_index.get(rel_path, [])
+        extra = [texts.get(rel_path, {}) for texts in others]
+        for idx, (id_msg, chara_id, subtype, msg) in enumerate(lang_data):
+            jp_msg = jap_data[idx] if idx < len(jap_data) else ""
+            yield (subdir, filename, id_msg, subtitleID.get(subtype, ""), characters.get(chara_id, ""), chara_id, msg, *[texts.get(id_msg, "") for texts in extra], jp_msg)
+
+def export_languages(lang_roots, jap_root, output, verbose, jobs=1, stream=False, combined=False):
+    tags = []
+    for lang_root in lang_roots:
+        tag = language_tag(lang_root)
+        tags.append(tag if tag not in tags else f"{tag}{len(tags)}")
+    languages = []
+    for lang_root in lang_roots:
+        pairs = walk_pairs(lang_root, jap_root)
+        languages.append([(subdir, filename, lang_path, os.path.relpath(lang_path, lang_root)) for subdir, filename, lang_path, _ in pairs])
+    jap_index = read_japanese(jap_root, {pair[3] for pairs in languages for pair in pairs}, jobs)
+    print(f" \033[38;5;75m[INFO]\033[00m Japanese files read once: {len(jap_index)}")
+    if combined:
+        characters, subtitleID = get_ids()
+        pairs = languages[0]; others = []
+        for other in languages[1:]:
+            texts = parse_files(read_texts, [lang_path for _, _, lang_path, _ in other], jobs)
+            others.append({rel_path: {id_msg: msg for id_msg, _, _, msg in lang_data} for (_, _, _, rel_path), lang_data in zip(other, texts)})
+        results = parse_files(read_texts, [lang_path for _, _, lang_path, _ in pairs], jobs)
+        header = SHEET_HEADER[:6] + [f"Original Text ({tag})" for tag in tags] + SHEET_HEADER[7:]
+        print(f"> Exporting to XLSX: \033[48;5;235m{output}\033[00m")
+        rows = combined_rows(pairs, results, others, jap_index, characters, subtitleID)
+        if stream:
+            export_xlsx_stream(rows, output, verbose, header)
+        else:
+            export_xlsx(list(rows), output, verbose, header)
+        return
+    base, ext = os.path.splitext(output)
+    tasks = []
+    for tag, pairs in zip(tags, languages):
+        rel_paths = {pair[3] for pair in pairs}
+        tasks.append((pairs, {rel_path: jap_index[rel_path] for rel_path in rel_paths}, f"{base}.{tag}{ext or '.xlsx'}", stream, verbose))
+        print(f"> Exporting to XLSX: \033[48;5;235m{tasks[-1][2]}\033[00m")
+    if jobs > 1 and len(tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with phase("export"), ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+            for counters in executor.map(export_language_job, tasks):
+                for name, amount in counters.items():
+                    add_stat(name, amount)
+    else:
+        for task in tasks:
+            export_language(*task)
+
+def apply_translations(xml_path, edits, verbose):
+    import xml.etree.ElementTree as ET
+    from html import unescape
+    with phase("parse"), open(xml_path, "r", encoding="utf-8") as f:
+        content = f.read()
+        root = ET.fromstring(content)
+    add_stat("files_parsed"); add_stat("bytes_read", os.path.getsize(xml_path))
+    id_index = {}
+    for text_content in root.find("TextContents").findall("TextContent"):
+        id_index.setdefault(text_content.get("ID", ""), text_content)
+    filename = os.path.basename(xml_path)
+    changes = 0; matched = set()
+    for msg_id, new_translation in edits:
+        if msg_id not in id_index:
+            if verbose: print(f" \033[38;5;214m[WARNING]\033[00m ID {msg_id} not found in {filename}")
+            continue
+        matched.add(msg_id)
+        message_elem = id_index[msg_id].find("Message")
+        if message_elem is None:
+            continue
+        new_text = unescape(new_translation.strip())
+        old_text = message_elem.text or ""
+        if old_text == new_text:
+            if verbose: print(f" \033[90m[SKIP] Message {msg_id} already translated, skipping.\033[00m")
+            continue
+        message_elem.text = new_text
+        if verbose: print(f" \033[38;5;75m[INFO]\033[00m {filename} (ID: {msg_id}): \033[38;5;210m\"{old_text}\"\033[00m -> \033[38;5;81m\"{new_text}\"\033[00m")
+        changes += 1
+    if changes:
+        if root.tag == "PzdFile":
+            root.set("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance")
+            root.set("xmlns:xsd", "http://www.w3.org/2001/XMLSchema")
+        write_xml(ET.ElementTree(root), xml_path)
+    return changes, matched
+
+def read_edits(xlsx_path, col_reference):
     from openpyxl import load_workbook
     from openpyxl.utils import column_index_from_string
-    from html import unescape
+    col_letter = "".join(filter(str.isalpha, col_reference.upper()))
+    col_idx = column_index_from_string(col_letter)
+    edits = []
+    with phase("read_xlsx"):
+        wb = load_workbook(xlsx_path, read_only=True)
+        try:
+            for sheet_name in wb.sheetnames[1:]:
+                for item in wb[sheet_name].iter_rows(min_row=2,values_only=True):
+                    if len(item) >= col_idx and item[col_idx - 1] is not None:
+                        subdir = item[0] if item[0] else ""
+                        filename = item[1] if item[1] else ""
+                        msg_id = str(item[2]) if item[2] else ""
+                        edits.append((subdir, filename, msg_id, str(item[col_idx - 1])))
+        finally:
+            wb.close()
+    add_stat("bytes_read", os.path.getsize(xlsx_path)); add_stat("rows_read", len(edits))
+    return edits
+
+def row_fingerprint(text):
+    import hashlib
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+def load_fingerprints(xlsx_path, lang_root):
+    import json
     try:
-        wb = load_workbook(xlsx_path)
-        all_sheets = {}
-        for sheet_name in wb.sheetnames[1:]:
-            sheet = wb[sheet_name]
-            sheet_data = []
-            for row in sheet.iter_rows(min_row=2,values_only=True):
-                sheet_data.append(list(row))
-            all_sheets[sheet_name] = sheet_data
-        col_letter = "".join(filter(str.isalpha, col_reference.upper()))
-        col_idx = column_index_from_string(col_letter)
+        with open(xlsx_path + ".applied.json", "r", encoding="utf-8") as f:
+            applied = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f" \033[38;5;214m[WARNING]\033[00m Could not read applied rows, applying all of them: {e}")
+        return {}
+    if applied.get("language") != os.path.abspath(lang_root):
+        return {}
+    return applied.get("rows", {})
+
+def save_fingerprints(xlsx_path, lang_root, fingerprints):
+    import json
+    with open(xlsx_path + ".applied.json.tmp", "w", encoding="utf-8") as f:
+        json.dump({"language": os.path.abspath(lang_root), "rows": fingerprints}, f)
+    os.replace(xlsx_path + ".applied.json.tmp", xlsx_path + ".applied.json")
+
+# Command: edit-xml
+@timed("edit")
+def edit_xml(xlsx_path, col_reference, lang_root, verbose, changed_only=False):
+    from collections import defaultdict
+    from time import perf_counter
+    try:
+        fingerprints = load_fingerprints(xlsx_path, lang_root) if changed_only else {}
+        edits_by_file = defaultdict(list); pending = defaultdict(dict); rows_skipped = 0
+        for subdir, filename, msg_id, new_translation in read_edits(xlsx_path, col_reference):
+            if changed_only:
+                row_key = f"{subdir}/{filename}/{msg_id}"; fingerprint = row_fingerprint(new_translation)
+                if fingerprints.get(row_key) == fingerprint:
+                    rows_skipped += 1
+                    continue
+                pending[(subdir, filename)][msg_id] = fingerprint
+            edits_by_file[(subdir, filename)].append((msg_id, new_translation))
         changes_made = 0
         files_processed = set()
+        file_times = []
+        manifest = load_manifest(lang_root)
         print("> Processing translations...")
-        for row, data in all_sheets.items():
-            for item in data:
-                if item[col_idx - 1] is not None:
-                    subdir = item[0] if item[0] else ""
-                    filename = item[1] if item[1] else ""
-                    msg_id = str(item[2]) if item[2] else ""
-                    new_translation = item[col_idx - 1] if item[col_idx - 1] else ""
-                    xml_filename = f"{filename}.pzd.xml"
-                    xml_path = os.path.join(lang_root, subdir, xml_filename) if subdir else os.path.join(lang_root, xml_filename)
-                    if not os.path.exists(xml_path):
-                        print(f" \033[91m[ERROR]\033[00m File not found: {xml_path}")
-                        continue
-                    try:
-                        with open(xml_path, "r", encoding="utf-8") as f:
-                            content = f.read()
-                        root = ET.fromstring(content)
-                        if root.tag == "PzdFile":
-                            root.set("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance")
-                            root.set("xmlns:xsd", "http://www.w3.org/2001/XMLSchema")
-                        text_contents = root.find("TextContents")
-                        if text_contents is not None:
-                            for text_content in text_contents.findall("TextContent"):
-                                if text_content.get("ID") == msg_id:
-                                    message_elem = text_content.find("Message")
-                                    if message_elem is not None:
-                                        old_text = message_elem.text or ""
-                                        message_elem.text = unescape(new_translation.strip())
-                                        if old_text == new_translation:
-                                            if verbose: print(f" \033[90m[SKIP] Message {msg_id} already translated, skipping.\033[00m")
-                                            continue
-                                        else:
-                                            if verbose: print(f" \033[38;5;75m[INFO]\033[00m {filename} (ID: {msg_id}): \033[38;5;210m\"{old_text}\"\033[00m -> \033[38;5;81m\"{new_translation.strip()}\"\033[00m")
-                                            changes_made += 1
-                                            files_processed.add(xml_path)
-                                        break
-                        tree = ET.ElementTree(root)
-                        write_xml(tree, xml_path)
-                    except Exception as e:
-                        print(f" \033[38;5;214m[WARNING]\033[00m Could not process {xml_path}: {e}")
-                        continue
+        start_time = perf_counter()
+        for (subdir, filename), edits in edits_by_file.items():
+            xml_filename = f"{filename}.pzd.xml"
+            xml_path = os.path.join(lang_root, subdir, xml_filename) if subdir else os.path.join(lang_root, xml_filename)
+            if not os.path.exists(xml_path):
+                print(f" \033[91m[ERROR]\033[00m File not found: {xml_path}")
+                continue
+            file_start = perf_counter()
+            try:
+                changes, matched = apply_translations(xml_path, edits, verbose)
+            except Exception as e:
+                print(f" \033[38;5;214m[WARNING]\033[00m Could not process {xml_path}: {e}")
+                continue
+            file_time = perf_counter() - file_start
+            file_times.append((file_time, xml_filename))
+            if verbose: print(f" \033[38;5;75m[INFO]\033[00m {xml_filename}: {len(edits)} rows, {changes} changes in {file_time * 1000:.1f} ms")
+            fingerprints.update((f"{subdir}/{filename}/{msg_id}", fingerprint) for msg_id, fingerprint in pending[(subdir, filename)].items() if msg_id in matched)
+            if changes:
+                changes_made += changes
+                files_processed.add(xml_path)
+                if manifest:
+                    key = manifest_key(lang_root, xml_path)
+                    manifest[key] = file_entry(xml_path, manifest.get(key))
+        if manifest and files_processed:
+            save_manifest(lang_root, manifest)
+        if changed_only:
+            save_fingerprints(xlsx_path, lang_root, fingerprints)
+        time_lapsed = perf_counter() - start_time
         print(f"\n \033[38;5;76m[DONE]\033[00m Summary:")
         print(f"   • {changes_made} translations applied.")
         print(f"   • {len(files_processed)} files modified.")
+        if changed_only:
+            print(f"   • {rows_skipped} unchanged rows skipped.")
+        print(f"   • {len(file_times)} files processed in {time_lapsed:.2f} s.")
+        if file_times:
+            slowest_time, slowest_file = max(file_times)
+            print(f"   • Slowest file: {slowest_file} ({slowest_time * 1000:.1f} ms).")
+        return files_processed
     except Exception as e:
         print(f" \033[91m[ERROR]\033[00m Error reading XLSX file: {e}")
 
+CONVERT_RETRIES = 2
+MAX_CHUNK_FILES = 400
+
+def chunk_files(ff16converter, files, chunk_size):
+    limit = (32000 if os.name == "nt" else 120000) - len(str(ff16converter))
+    chunks = []; chunk = []; length = 0
+    for file in files:
+        size = len(str(file)) + 3
+        if chunk and (len(chunk) >= chunk_size or length + size > limit):
+            chunks.append(chunk); chunk = []; length = 0
+        chunk.append(file); length += size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+def run_converter(ff16converter, chunk):
+    import subprocess
+    from time import perf_counter
+    start = perf_counter()
+    for attempt in range(CONVERT_RETRIES + 1):
+        result = subprocess.run([ff16converter] + [str(file) for file in chunk], capture_output=True, text=True)
+        if result.returncode == 0 and not result.stderr.strip():
+            break
+    return result, attempt, start, perf_counter()
+
+def run_conversions(ff16converter, folder_group, jobs, verbose):
+    from collections import defaultdict
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    total_files = sum(len(files) for files in folder_group.values())
+    chunk_size = max(1, min(MAX_CHUNK_FILES, -(-total_files // max(1, jobs))))
+    folder_times = defaultdict(list); converted = []
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        futures = {}
+        for folder, files in folder_group.items():
+            if verbose: print(f" \033[38;5;75m[INFO]\033[00m Converting files on: \033[38;5;81m{folder}\033[00m")
+            for chunk in chunk_files(ff16converter, files, chunk_size):
+                futures[executor.submit(run_converter, ff16converter, chunk)] = (folder, chunk)
+        for future in as_completed(futures):
+            folder, chunk = futures[future]
+            try:
+                result, retries, chunk_start, chunk_end = future.result()
+            except Exception as e:
+                print(f" \033[91m[ERROR]\033[00m Error converting: {e}")
+                continue
+            add_stat("converter_processes", retries + 1)
+            if result.returncode != 0 or result.stderr.strip():
+                folder_times[folder].append((chunk_start, chunk_end, 0))
+                error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else f"exit code {result.returncode}"
+                print(f" \033[91m[ERROR]\033[00m Error converting {len(chunk)} files on {folder} ({chunk[0].name}...): {error}")
+                continue
+            folder_times[folder].append((chunk_start, chunk_end, len(chunk)))
+            add_stat("files_converted", len(chunk)); converted += chunk
+            if retries and verbose:
+                print(f" \033[38;5;214m[WARNING]\033[00m Chunk on {folder} ({chunk[0].name}...) converted after {retries} retries")
+    for folder, times in folder_times.items():
+        folder_lapsed = max(end for _, end, _ in times) - min(start for start, _, _ in times)
+        folder_files = sum(count for _, _, count in times)
+        print(f" \033[38;5;75m[INFO]\033[00m {folder}: {folder_files} files in {folder_lapsed:.2f} s ({folder_files / folder_lapsed if folder_lapsed else 0:.1f} files/s)")
+    return converted
+
 # Command: convert-batch
-def convert_batch(ff16converter, lang_path, valid_ext, verbose):
+@timed("convert")
+def convert_batch(ff16converter, lang_path, valid_ext, verbose, jobs=1, incremental=False, moveto=None):
     from pathlib import Path
     from time import perf_counter
     from collections import defaultdict
-    import subprocess
     lang_path = Path(lang_path)
     if not lang_path.exists():
         print(f" \033[91m[ERROR]\033[00m Folder {lang_path} does not exist")
@@ -227,86 +745,489 @@ def convert_batch(ff16converter, lang_path, valid_ext, verbose):
         return
     valid_ext = [valid_ext]
     print(f"> Converting files in: \033[48;5;235m{lang_path}\033[00m\n> Processing. This may take a while...")
-    files_to_convert = [
-        file for file in lang_path.rglob("*")
-        if file.suffix.lower() in valid_ext and file.is_file()
-    ]
+    with phase("walk"):
+        files_to_convert = [
+            file for file in lang_path.rglob("*")
+            if file.suffix.lower() in valid_ext and file.is_file()
+        ]
+    add_stat("files_walked", len(files_to_convert))
     if verbose: print(f" \033[38;5;75m[INFO]\033[00m {len(files_to_convert)} files to convert")
     folder_group = defaultdict(list); start_time = perf_counter()
+    manifest = load_manifest(lang_path) if incremental else {}
     for file in files_to_convert:
-        if valid_ext == [".pzd"]:
-            has_xml = Path(str(file) + ".xml")
-            if has_xml.exists():
-                if verbose: print(f" \033[90m[SKIP] {has_xml.name} already exists, skipping.\033[00m")
+        output = Path(output_path(file, valid_ext[0]))
+        if incremental:
+            key = manifest_key(lang_path, file)
+            manifest[key] = file_entry(file, manifest.get(key))
+            if not is_stale(file, output, manifest[key], moved_path(output, lang_path, moveto) if moveto else None):
+                if verbose: print(f" \033[90m[SKIP] {output.name} is up to date, skipping.\033[00m")
                 continue
-            folder_group[str(file.parent.name)].append(file)
-        else:
-            has_pzd = Path(str(file) + "RB.pzd")
-            if has_pzd.exists():
-                if verbose: print(f" \033[90m[SKIP] {has_pzd.name} already exists, skipping.\033[00m")
-                continue
-            folder_group[str(file.parent.name)].append(file)
-    for folder, files in folder_group.items():
-        try:
-            if verbose: print(f" \033[38;5;75m[INFO]\033[00m Converting files on: \033[38;5;81m{folder}\033[00m")
-            if folder == "defaultq" or folder == "simpleq":
-                helper = []
-                for i in range(0, len(files), 400):
-                    helper.append(files[i:i + 400])
-                for chunk in helper:
-                    subprocess.run([ff16converter] + [str(file) for file in chunk], capture_output=True, text=True)
-            else:
-                subprocess.run([ff16converter] + [str(file) for file in files], capture_output=True, text=True)
-        except Exception as e:
-            print(f" \033[91m[ERROR]\033[00m Error converting: {e}")
+        elif output.exists():
+            if verbose: print(f" \033[90m[SKIP] {output.name} already exists, skipping.\033[00m")
+            continue
+        folder_group[str(file.parent.name)].append(file)
+    for file in run_conversions(ff16converter, folder_group, jobs, verbose):
+        if incremental:
+            mark_converted(manifest[manifest_key(lang_path, file)], output_path(file, valid_ext[0]))
+    if incremental:
+        save_manifest(lang_path, manifest)
     time_lapsed = perf_counter() - start_time
     print(f" \033[38;5;76m[DONE]\033[00m Files converted in {int(time_lapsed // 3600):02d}:{int((time_lapsed % 3600) // 60):02d}:{int(time_lapsed % 60):02d}")
 
-# Command: move-batch
-def move_converted(this_directory, to_directory, extension, verbose):
+# Command: watch
+@timed("watch")
+def watch(xlsx_path, col_reference, lang_root, ff16converter, interval, debounce, jobs, verbose):
     from pathlib import Path
+    from collections import defaultdict
+    from time import sleep, monotonic
+    if not os.path.isdir(lang_root):
+        print(f" \033[91m[ERROR]\033[00m Folder {lang_root} does not exist")
+        return
+    if ff16converter and not os.path.exists(ff16converter):
+        print(f" \033[91m[ERROR]\033[00m Converter {ff16converter} does not exist")
+        return
+    def xlsx_state():
+        try:
+            stat = os.stat(xlsx_path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+    def xml_state():
+        states = {}
+        for path in scan_files(lang_root, ".pzd.xml"):
+            try:
+                states[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                pass
+        return states
+    print(f"> Watching: \033[48;5;235m{xlsx_path}\033[00m and \033[48;5;235m{lang_root}\033[00m\n> Press Ctrl+C to stop.")
+    known_xlsx = None; xlsx_changed_at = None
+    known_xml = xml_state(); pending_xml = {}
+    try:
+        while True:
+            now = monotonic(); edited = set()
+            state = xlsx_state()
+            if state != known_xlsx:
+                known_xlsx = state; xlsx_changed_at = now
+            if state and xlsx_changed_at is not None and now - xlsx_changed_at >= debounce:
+                xlsx_changed_at = None
+                print(f"> Applying translations from: \033[48;5;235m{xlsx_path}\033[00m")
+                edited = edit_xml(xlsx_path, col_reference, lang_root, verbose, changed_only=True) or set()
+            current = xml_state()
+            for path, mtime in current.items():
+                if known_xml.get(path) != mtime:
+                    pending_xml[path] = now
+            known_xml = current
+            for path in edited:
+                pending_xml[path] = now - debounce
+            ready = [path for path, changed_at in pending_xml.items() if now - changed_at >= debounce]
+            for path in ready:
+                del pending_xml[path]
+            if ready and ff16converter:
+                print(f"> Converting {len(ready)} changed files...")
+                folder_group = defaultdict(list)
+                for path in ready:
+                    folder_group[os.path.basename(os.path.dirname(path))].append(Path(path))
+                converted = run_conversions(ff16converter, folder_group, jobs, verbose)
+                manifest = load_manifest(lang_root)
+                if manifest:
+                    for file in converted:
+                        key = manifest_key(lang_root, file)
+                        manifest[key] = file_entry(file, manifest.get(key)); mark_converted(manifest[key], output_path(file, ".xml"))
+                    save_manifest(lang_root, manifest)
+                print(f" \033[38;5;76m[DONE]\033[00m {len(converted)} files converted.")
+            elif ready and verbose:
+                for path in ready:
+                    print(f" \033[38;5;75m[INFO]\033[00m Changed: {os.path.relpath(path, lang_root)}")
+            sleep(interval)
+    except KeyboardInterrupt:
+        print(f" \033[38;5;76m[DONE]\033[00m Watch stopped.")
+
+MOVE_JOURNAL = "FF16SubsMove.journal"
+
+def scan_files(root, suffix):
+    found = []; folders = [root]
+    while folders:
+        with os.scandir(folders.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    folders.append(entry.path)
+                elif entry.name.endswith(suffix):
+                    found.append(entry.path)
+    return found
+
+def move_file(source, destination, same_device):
     import shutil
-    Path.mkdir(Path(to_directory), parents=True, exist_ok=True)
+    try:
+        if same_device:
+            os.replace(source, destination)
+        else:
+            shutil.move(source, destination)
+    except FileNotFoundError:
+        if not os.path.exists(destination):
+            raise
+
+def plan_moves(this_directory, to_directory, extension, verbose):
+    with phase("walk"):
+        converted_files = scan_files(this_directory, "RB.pzd" if extension == ".xml" else ".pzd.xml")
+    add_stat("files_walked", len(converted_files))
+    moves = []
+    for file in converted_files:
+        moves.append((file, moved_path(file, this_directory, to_directory)))
+    existing = {}
+    for folder in sorted({os.path.dirname(destination) for _, destination in moves}):
+        os.makedirs(folder, exist_ok=True)
+        existing[folder] = set(os.listdir(folder))
+    planned = []
+    for source, destination in moves:
+        if os.path.basename(destination) in existing[os.path.dirname(destination)]:
+            if verbose: print(f" \033[90m[SKIP] {os.path.relpath(destination, to_directory)} already exists, skipping.\033[00m")
+            continue
+        planned.append((source, destination))
+    return planned
+
+def run_moves(moves, journal, same_device, jobs, verbose, undo=False):
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    moved = 0
+    with ThreadPoolExecutor(max_workers=1 if same_device else max(1, jobs)) as executor:
+        futures = {}
+        for index, (source, destination) in moves:
+            if undo:
+                source, destination = destination, source
+            futures[executor.submit(move_file, source, destination, same_device)] = (index, source, destination)
+        for future in as_completed(futures):
+            index, source, destination = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                print(f" \033[91m[ERROR]\033[00m Error moving {os.path.basename(source)}: {e}")
+                continue
+            journal.write(f"{'-' if undo else ''}{index}\n"); journal.flush()
+            moved += 1; add_stat("files_moved")
+            if verbose: print(f" \033[38;5;75m[INFO]\033[00m Moved: \033[38;5;81m{os.path.basename(source)}\033[00m to \033[48;5;235m{os.path.dirname(destination)}\033[00m")
+    return moved
+
+def read_journal(journal_path):
+    import json
+    with open(journal_path, "r", encoding="utf-8") as f:
+        plan = json.loads(f.readline())
+        done = set()
+        for line in f:
+            line = line.strip()
+            if line.startswith("-"):
+                done.discard(int(line[1:]))
+            elif line:
+                done.add(int(line))
+    return plan, done
+
+# Command: move-batch
+@timed("move")
+def move_converted(this_directory, to_directory, extension, verbose, jobs=4, resume=False, rollback=False):
+    import json
+    if not (resume or rollback) and not extension:
+        print(f" \033[91m[ERROR]\033[00m Extension not set.")
+        return
+    if not (resume or rollback) and not os.path.isdir(this_directory):
+        print(f" \033[91m[ERROR]\033[00m Folder {this_directory} does not exist")
+        return
+    this_directory = os.path.abspath(this_directory); to_directory = os.path.abspath(to_directory)
+    os.makedirs(to_directory, exist_ok=True)
+    journal_path = os.path.join(to_directory, MOVE_JOURNAL)
+    if os.path.exists(journal_path) and not (resume or rollback):
+        print(f" \033[91m[ERROR]\033[00m A previous move to {to_directory} was interrupted, use --resume or --rollback first.")
+        return
+    if (resume or rollback) and not os.path.exists(journal_path):
+        print(f" \033[91m[ERROR]\033[00m No interrupted move found in {to_directory}.")
+        return
     print(f"> Moving files to: \033[48;5;235m{to_directory}\033[00m\n> Processing. This may take a while...")
-    match extension:
-        case ".xml":
-            converted_files = list(Path(this_directory).rglob("*RB.pzd"))
-            if not converted_files:
-                return
-            for file in converted_files:
-                try:
-                    relative_path = file.relative_to(this_directory)
-                    original_name = file.name.replace(".pzd.xmlRB.pzd",".pzd")
-                    destination_file = to_directory / relative_path.parent / original_name
-                    Path.mkdir(destination_file.parent, parents=True, exist_ok=True)
-                    if destination_file.exists():
-                        if verbose: print(f" \033[90m[SKIP] {original_name} already exists, skipping.\033[00m")
-                        continue
-                    shutil.move(str(file), str(destination_file))
-                    if verbose: print(f" \033[38;5;75m[INFO]\033[00m Moved: \033[38;5;81m{file.name}\033[00m to \033[48;5;235m{destination_file.parent}\033[00m")
-                except Exception as e:
-                    print(f" \033[91m[ERROR]\033[00m Error moving {file.name}: {e}")
-        case ".pzd":
-            converted_files = list(Path(this_directory).rglob("*.pzd.xml"))
-            if not converted_files:
-                return
-            for file in converted_files:
-                try:
-                    relative_path = file.relative_to(this_directory)
-                    destination_folder = to_directory / relative_path.parent
-                    destination_file = destination_folder.parent / relative_path
-                    Path.mkdir(destination_folder, parents=True, exist_ok=True)
-                    if destination_file.exists():
-                        if verbose: print(f" \033[90m[SKIP] {relative_path} already exists, skipping.\033[00m")
-                        continue
-                    shutil.move(str(file), str(destination_folder))
-                    if verbose: print(f" \033[38;5;75m[INFO]\033[00m Moved: \033[38;5;81m{file.name}\033[00m to \033[48;5;235m{destination_folder}\033[00m")
-                except Exception as e:
-                    print(f" \033[91m[ERROR]\033[00m Error moving {file.name}: {e}")
-    print(f" \033[38;5;76m[DONE]\033[00m Move operation completed.")
+    if resume or rollback:
+        plan, done = read_journal(journal_path)
+        this_directory = plan["source"]
+        moves = list(enumerate(plan["moves"]))
+        if rollback:
+            pending = [(index, (source, destination)) for index, (source, destination) in moves
+                       if index in done or (not os.path.exists(source) and os.path.exists(destination))]
+        else:
+            pending = [(index, move) for index, move in moves if index not in done]
+    else:
+        planned = plan_moves(this_directory, to_directory, extension, verbose)
+        if not planned:
+            return
+        with open(journal_path, "w", encoding="utf-8") as journal:
+            journal.write(json.dumps({"source": this_directory, "moves": planned}) + "\n")
+        pending = list(enumerate(planned))
+    same_device = os.stat(this_directory).st_dev == os.stat(to_directory).st_dev
+    with open(journal_path, "a", encoding="utf-8") as journal:
+        moved = run_moves(pending, journal, same_device, jobs, verbose, undo=rollback)
+    if moved == len(pending):
+        os.remove(journal_path)
+    else:
+        print(f" \033[38;5;214m[WARNING]\033[00m {len(pending) - moved} files could not be moved, run again with --resume or --rollback.")
+    if rollback:
+        print(f" \033[38;5;76m[DONE]\033[00m {moved} files moved back.")
+    else:
+        print(f" \033[38;5;76m[DONE]\033[00m Move operation completed.")
+
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, seq INTEGER, folder TEXT, filename TEXT, lang_mtime INTEGER, ja_mtime INTEGER);
+CREATE TABLE IF NOT EXISTS lines (path TEXT, idx INTEGER, folder TEXT, filename TEXT, id TEXT, chara_id TEXT, subtype TEXT, message TEXT, japanese TEXT, mtime INTEGER, PRIMARY KEY (path, idx));
+CREATE INDEX IF NOT EXISTS lines_id ON lines (id);
+CREATE INDEX IF NOT EXISTS lines_chara ON lines (chara_id);
+CREATE INDEX IF NOT EXISTS lines_file ON lines (folder, filename);
+"""
+
+def open_index(db_path):
+    import sqlite3
+    conn = sqlite3.connect(db_path)
+    conn.executescript(INDEX_SCHEMA)
+    return conn
+
+# Command: index
+@timed("index")
+def update_index(db_path, lang_root, jap_root, jobs=1, verbose=False):
+    from time import perf_counter
+    start_time = perf_counter()
+    print(f"> Indexing: \033[48;5;235m{lang_root}\033[00m")
+    conn = open_index(db_path)
+    try:
+        roots = f"{os.path.abspath(lang_root)}|{os.path.abspath(jap_root)}"
+        if conn.execute("SELECT value FROM meta WHERE key = 'roots'").fetchone() != (roots,):
+            conn.execute("DELETE FROM files"); conn.execute("DELETE FROM lines")
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('roots', ?)", (roots,))
+        stored = {path: (lang_mtime, ja_mtime) for path, lang_mtime, ja_mtime in conn.execute("SELECT path, lang_mtime, ja_mtime FROM files")}
+        walked = []; stale = []
+        for seq, (subdir, filename, lang_path, jap_path) in enumerate(walk_pairs(lang_root, jap_root)):
+            rel_path = os.path.relpath(lang_path, lang_root).replace(os.sep, "/")
+            mtimes = (os.stat(lang_path).st_mtime_ns, os.stat(jap_path).st_mtime_ns)
+            walked.append((seq, rel_path))
+            if stored.get(rel_path) != mtimes:
+                stale.append((seq, rel_path, subdir, filename, mtimes, (lang_path, jap_path)))
+        for (seq, rel_path, subdir, filename, mtimes, _), (lang_data, jap_data) in zip(stale, read_pairs([item[5] for item in stale], jobs)):
+            if verbose: print(f" \033[38;5;75m[INFO]\033[00m Indexing: {rel_path}")
+            conn.execute("DELETE FROM lines WHERE path = ?", (rel_path,))
+            conn.executemany("INSERT INTO lines VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", [
+                (rel_path, idx, subdir, filename, id_msg, chara_id, subtype, en_msg, jap_data[idx] if idx < len(jap_data) else "", mtimes[0])
+                for idx, (id_msg, chara_id, subtype, en_msg) in enumerate(lang_data)
+            ])
+            conn.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)", (rel_path, seq, subdir, filename, mtimes[0], mtimes[1]))
+        conn.executemany("UPDATE files SET seq = ? WHERE path = ?", walked)
+        removed = stored.keys() - {rel_path for _, rel_path in walked}
+        for rel_path in removed:
+            conn.execute("DELETE FROM files WHERE path = ?", (rel_path,)); conn.execute("DELETE FROM lines WHERE path = ?", (rel_path,))
+        conn.commit()
+    finally:
+        conn.close()
+    print(f" \033[38;5;76m[DONE]\033[00m Index updated in {perf_counter() - start_time:.2f} s: {len(stale)} files indexed, {len(walked) - len(stale)} unchanged, {len(removed)} removed.")
+
+def iter_index(db_path):
+    characters, subtitleID = get_ids()
+    conn = open_index(db_path)
+    try:
+        for subdir, filename, id_msg, subtype, chara_id, en_msg, jp_msg in conn.execute(
+            "SELECT lines.folder, lines.filename, id, subtype, chara_id, message, japanese FROM lines JOIN files USING (path) ORDER BY files.seq, lines.idx"
+        ):
+            yield (subdir, filename, id_msg, subtitleID.get(subtype, ""), characters.get(chara_id, ""), chara_id, en_msg, jp_msg)
+    finally:
+        conn.close()
+
+# Command: query
+@timed("query")
+def query_index(db_path, msg_id=None, chara_id=None, subtype=None, folder=None, filename=None, text=None, limit=None, verbose=False):
+    characters, subtitleID = get_ids()
+    if not os.path.exists(db_path):
+        print(f" \033[91m[ERROR]\033[00m Index {db_path} does not exist, run 'index' first.")
+        return
+    conditions = []; params = []
+    if msg_id:
+        conditions.append("id = ?"); params.append(msg_id)
+    if chara_id:
+        conditions.append("chara_id = ?"); params.append(chara_id)
+    if subtype:
+        subtype_codes = {name.lower(): code for code, name in subtitleID.items()}
+        conditions.append("subtype = ?"); params.append(subtype_codes.get(subtype.lower(), subtype))
+    if folder:
+        conditions.append("lines.folder = ?"); params.append(folder)
+    if filename:
+        conditions.append("lines.filename = ?"); params.append(filename)
+    if text:
+        conditions.append("(message LIKE ? OR japanese LIKE ?)"); params += [f"%{text}%"] * 2
+    sql = "SELECT lines.folder, lines.filename, id, chara_id, subtype, message, japanese FROM lines JOIN files USING (path)"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += " ORDER BY files.seq, lines.idx"
+    if limit:
+        sql += f" LIMIT {int(limit)}"
+    conn = open_index(db_path); found = 0
+    try:
+        for subdir, name, id_msg, chara, sub_type, message, japanese in conn.execute(sql, params):
+            found += 1
+            print(f" \033[90m{subdir}/{name}\033[00m \033[38;5;81m{id_msg}\033[00m [{subtitleID.get(sub_type, sub_type)}] {characters.get(chara, '')} ({chara}): {message}")
+            if verbose: print(f"   \033[90m{japanese}\033[00m")
+    finally:
+        conn.close()
+    print(f" \033[38;5;76m[DONE]\033[00m {found} lines found.")
+
+MARKUP_PATTERN = r"<[^<>]*>|\{[^{}]*\}"
+VALIDATION_CHECKS = {
+    "missing-japanese-file": "language files without a Japanese file",
+    "missing-language-file": "Japanese files without a language file",
+    "unreadable": "files that couldn't be read",
+    "duplicate-id": "IDs repeated in a file",
+    "missing-japanese-id": "IDs missing in the Japanese file",
+    "missing-language-id": "IDs missing in the language file",
+    "misaligned": "files whose Japanese lines are paired with the wrong ID",
+    "missing-file": "files referenced by the XLSX that don't exist",
+    "unknown-id": "XLSX rows with an ID not found in their file",
+    "br-count": "translations with a different number of <br>",
+    "br-newline": "translations with a <br> not followed by a newline",
+    "markup": "translations with different markup tokens",
+}
+
+def markup_tokens(text):
+    import re
+    return sorted(token for token in re.findall(MARKUP_PATTERN, text) if token != "<br>")
+
+def check_translation(original, translation):
+    import re
+    from html import unescape
+    text = unescape(translation.strip())
+    if text.count("<br>") != original.count("<br>"):
+        return "br-count", f"{text.count('<br>')} <br> in translation, {original.count('<br>')} in original"
+    if re.search(r"<br>(?!\r?\n)", text) and not re.search(r"<br>(?!\r?\n)", original):
+        return "br-newline", "<br> not followed by a newline"
+    if markup_tokens(text) != markup_tokens(original):
+        return "markup", f"{' '.join(markup_tokens(text)) or 'none'} in translation, {' '.join(markup_tokens(original)) or 'none'} in original"
+    return None
+
+def validate_file(task):
+    rel_path, lang_path, jap_path, edits = task
+    issues = []
+    try:
+        lang_data = [(msg_id, message) for msg_id, _, _, message in iter_texts(lang_path, strip=False)]
+        jap_ids = [msg_id for msg_id, _, _, _ in iter_texts(jap_path)] if jap_path else None
+    except Exception as e:
+        return [("unreadable", rel_path, "", str(e))]
+    messages = {}
+    for msg_id, message in lang_data:
+        if msg_id in messages:
+            issues.append(("duplicate-id", rel_path, msg_id, "ID appears more than once"))
+        messages.setdefault(msg_id, message)
+    if jap_ids is not None:
+        jap_set = set(jap_ids)
+        issues.extend(("missing-japanese-id", rel_path, msg_id, "not in the Japanese file") for msg_id in messages if msg_id not in jap_set)
+        issues.extend(("missing-language-id", rel_path, msg_id, "only in the Japanese file") for msg_id in dict.fromkeys(jap_ids) if msg_id not in messages)
+        misaligned = [(lang_id, jap_id) for (lang_id, _), jap_id in zip(lang_data, jap_ids) if lang_id != jap_id]
+        if misaligned:
+            issues.append(("misaligned", rel_path, misaligned[0][0], f"{len(misaligned)} lines paired with another ID, first with Japanese ID {misaligned[0][1]}"))
+    for msg_id, translation in edits:
+        if msg_id not in messages:
+            issues.append(("unknown-id", rel_path, msg_id, "ID not found in file"))
+            continue
+        problem = check_translation(messages[msg_id], translation)
+        if problem:
+            issues.append((problem[0], rel_path, msg_id, problem[1]))
+    return issues
+
+# Command: validate
+@timed("validate")
+def validate_trees(lang_root, jap_root, xlsx_path=None, col_reference="I2", jobs=1, verbose=False):
+    from collections import Counter, defaultdict
+    for root in (lang_root, jap_root):
+        if not os.path.isdir(root):
+            print(f" \033[91m[ERROR]\033[00m Folder {root} does not exist")
+            return 1
+    with phase("walk"):
+        lang_files = {os.path.relpath(path, lang_root): path for path in scan_files(lang_root, ".xml")}
+        jap_files = {os.path.relpath(path, jap_root): path for path in scan_files(jap_root, ".xml")}
+    add_stat("files_walked", len(lang_files) + len(jap_files))
+    issues = [("missing-language-file", rel_path, "", "no language file") for rel_path in sorted(jap_files) if rel_path not in lang_files]
+    edits_by_file = defaultdict(list)
+    if xlsx_path:
+        try:
+            edits = read_edits(xlsx_path, col_reference)
+        except Exception as e:
+            print(f" \033[91m[ERROR]\033[00m Error reading XLSX file: {e}")
+            return 1
+        for subdir, filename, msg_id, translation in edits:
+            edits_by_file[os.path.join(subdir, f"{filename}.pzd.xml") if subdir else f"{filename}.pzd.xml"].append((msg_id, translation))
+        for rel_path in sorted(edits_by_file):
+            if rel_path not in lang_files:
+                issues.append(("missing-file", rel_path, "", f"{len(edits_by_file[rel_path])} rows point at a file that doesn't exist"))
+    tasks = []
+    for rel_path in sorted(lang_files):
+        if rel_path not in jap_files:
+            issues.append(("missing-japanese-file", rel_path, "", "no Japanese file"))
+        tasks.append((rel_path, lang_files[rel_path], jap_files.get(rel_path), edits_by_file.get(rel_path, [])))
+    print(f"> Validating {len(tasks)} files...")
+    with phase("parse"):
+        if jobs > 1 and len(tasks) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                results = list(executor.map(validate_file, tasks, chunksize=max(1, len(tasks) // (jobs * 4))))
+        else:
+            results = list(map(validate_file, tasks))
+    for task, file_issues in zip(tasks, results):
+        if verbose: print(f" \033[38;5;75m[INFO]\033[00m {task[0]}: {len(task[3])} rows, {len(file_issues)} issues")
+        issues.extend(file_issues)
+    add_stat("files_parsed", len(tasks) + sum(1 for task in tasks if task[2])); add_stat("bytes_read", sum(os.path.getsize(task[1]) + (os.path.getsize(task[2]) if task[2] else 0) for task in tasks))
+    add_stat("rows_read", sum(len(edits) for edits in edits_by_file.values())); add_stat("issues", len(issues))
+    for kind, rel_path, msg_id, detail in issues:
+        location = f"{rel_path} (ID: {msg_id})" if msg_id else rel_path
+        print(f" \033[91m[ERROR]\033[00m {location}: {detail}")
+    if not issues:
+        print(f" \033[38;5;76m[DONE]\033[00m No issues found.")
+        return 0
+    print(f"\n \033[91m[FAILED]\033[00m Summary:")
+    for kind, total in Counter(kind for kind, _, _, _ in issues).items():
+        print(f"   • {total} {VALIDATION_CHECKS[kind]}.")
+    return len(issues)
+
+def run_command(args):
+    if args.command == "to-xlsx" and args.language and len(args.language) > 1:
+        export_languages(args.language, args.japanese, args.output, args.verbose, args.jobs, args.stream, args.combined)
+    elif args.command == "to-xlsx":
+        language = args.language[0] if args.language else None
+        if args.index and language and args.japanese:
+            update_index(args.index, language, args.japanese, args.jobs, args.verbose)
+        if args.index and not os.path.exists(args.index):
+            print(f" \033[91m[ERROR]\033[00m Index {args.index} does not exist, run 'index' first.")
+            return
+        print(f"> Exporting to XLSX: \033[48;5;235m{args.output}\033[00m")
+        rows = iter_index(args.index) if args.index else iter_table(language, args.japanese, args.jobs)
+        if args.stream:
+            export_xlsx_stream(rows, args.output, args.verbose)
+        else:
+            export_xlsx(list(rows), args.output, args.verbose)
+    elif args.command == "edit-xml":
+        print(f"> Applying translations from: \033[48;5;235m{args.file}\033[00m")
+        edit_xml(args.file, args.col, args.language, args.verbose, args.changed_only)
+    elif args.command == "convert-batch":
+        convert_batch(args.converter,args.folder,args.extension, args.verbose, args.jobs, args.incremental, args.moveto)
+        if args.moveto and args.extension:
+            move_converted(args.folder, args.moveto, args.extension, args.verbose)
+    elif args.command == "move-batch":
+        move_converted(args.folder, args.moveto, args.extension, args.verbose, args.jobs, args.resume, args.rollback)
+    elif args.command == "index":
+        update_index(args.database, args.language, args.japanese, args.jobs, args.verbose)
+    elif args.command == "watch":
+        watch(args.file, args.col, args.language, args.converter, args.interval, args.debounce, args.jobs, args.verbose)
+    elif args.command == "query":
+        query_index(args.database, args.id, args.character, args.subtype, args.folder, args.file, args.text, args.limit, args.verbose)
+    elif args.command == "validate":
+        return 1 if validate_trees(args.language, args.japanese, args.file, args.col, args.jobs, args.verbose) else 0
+
+def enable_colors():
+    if os.name != "nt":
+        return
+    import ctypes
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(-11); mode = ctypes.c_uint32()
+    if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        kernel32.SetConsoleMode(handle, mode.value | 0x0004)
 
 def main():
-    os.system("color")
+    enable_colors()
     parser = argparse.ArgumentParser(
         description="""\033[38;5;81m
  +----------------------------------------------+
@@ -330,49 +1251,108 @@ examples:
   \033[90m# Move files to another destination by extension\033[00m
   > \033[38;5;149mFF16SubsOrganizer.py\033[00m move-batch \033[38;5;149m-f\033[00m \033[38;5;222m"C:\path\\to\\folder\\0007.en.XML"\033[00m \033[38;5;149m--pzd\033[00m \033[38;5;149m-m\033[00m \033[38;5;222m"C:\path\\to\\folder\\0007.en.PZD"\033[00m""")
     subparsers = parser.add_subparsers(dest="command", required=True, help="Available commands")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--profile", nargs="?", const="", metavar="FILE", help="Profile the command, print the slowest calls or save them to FILE")
+    common.add_argument("--stats-json", metavar="FILE", help="Write phase timings, counters and peak memory to a JSON file")
     # to-xlsx command
-    xlsx_parser = subparsers.add_parser("to-xlsx", help="Export subtitles to XLSX file.")
-    xlsx_parser.add_argument("-l", "--language", required=True, help="Path to language subs folder to translate")
-    xlsx_parser.add_argument("-j", "--japanese", required=True, help="Path to Japanese  subsfolder")
+    xlsx_parser = subparsers.add_parser("to-xlsx", help="Export subtitles to XLSX file.", parents=[common])
+    xlsx_parser.add_argument("-l", "--language", action="append", help="Path to language subs folder to translate, repeat it to export several languages")
+    xlsx_parser.add_argument("-j", "--japanese", help="Path to Japanese  subsfolder")
+    xlsx_parser.add_argument("--index", help="Export from an index database (refreshed first when -l and -j are set)")
     xlsx_parser.add_argument("-o", "--output", default="ff16_subtitles.xlsx", help="Output xlsx file")
+    xlsx_parser.add_argument("--jobs", type=int, default=1, help="Number of processes used to read XML files (default: 1)")
+    xlsx_parser.add_argument("--stream", action="store_true", help="Write the XLSX file row by row with constant memory usage")
+    xlsx_parser.add_argument("--combined", action="store_true", help="With several -l, write one XLSX file with a column per language")
     xlsx_parser.add_argument("-v", "--verbose", action="store_true", help="Show detailed output messages")
     # edit-xml command
-    edit_parser = subparsers.add_parser("edit-xml", help="Gets translations from XLSX back to XML files.")
+    edit_parser = subparsers.add_parser("edit-xml", help="Gets translations from XLSX back to XML files.", parents=[common])
     edit_parser.add_argument("-f", "--file", required=True, help="XLSX file path")
     edit_parser.add_argument("-col", required=True, help="Column with new translations (e.g. I2)")
     edit_parser.add_argument("-l", "--language", required=True, help="Path to language to translate folder (e.g. C:\...\0007.en\nxd\text)")
+    edit_parser.add_argument("--changed-only", action="store_true", help="Only apply rows changed since the last --changed-only run")
     edit_parser.add_argument("-v", "--verbose", action="store_true", help="Show detailed output messages")
     # convert-batch command
-    batch_parser = subparsers.add_parser("convert-batch", help="Convert files to another format, pzd->xml OR xml->pzd.")
+    batch_parser = subparsers.add_parser("convert-batch", help="Convert files to another format, pzd->xml OR xml->pzd.", parents=[common])
     batch_parser.add_argument("-c", "--converter", required=True, help="Path to FF16Converter.exe")
     batch_parser.add_argument("-f", "--folder", required=True, help="Path to language folder")
     batch_parser.add_argument("--pzd", action="store_const", const=".pzd", dest="extension", help="Extension to convert (pzd -> xml).")
     batch_parser.add_argument("--xml", action="store_const", const=".xml", dest="extension", help="Extension to convert (xml -> pzd).")
     batch_parser.add_argument("-m", "--moveto", help="Path to converted files folder destination.")
+    batch_parser.add_argument("--incremental", action="store_true", help="Only convert files changed since the last incremental run")
+    batch_parser.add_argument("--jobs", type=int, default=1, help="Number of FF16Converter processes to run at once (default: 1)")
     batch_parser.add_argument("-v", "--verbose", action="store_true", help="Show detailed output messages")
     # move-batch command
-    move_parser = subparsers.add_parser("move-batch", help="Move files to another destination.")
+    move_parser = subparsers.add_parser("move-batch", help="Move files to another destination.", parents=[common])
     move_parser.add_argument("-f", "--folder", required=True, help="Path to parent folder.")
     move_parser.add_argument("--pzd", action="store_const", const=".pzd", dest="extension", help="Move PZD files.")
     move_parser.add_argument("--xml", action="store_const", const=".xml", dest="extension", help="Move XML files.")
     move_parser.add_argument("-m", "--moveto", required=True, help="Path to folder destination.")
+    move_parser.add_argument("--jobs", type=int, default=4, help="Number of threads copying files to another drive (default: 4)")
+    move_parser.add_argument("--resume", action="store_true", help="Finish an interrupted move to the destination folder")
+    move_parser.add_argument("--rollback", action="store_true", help="Move back the files of an interrupted move")
     move_parser.add_argument("-v", "--verbose", action="store_true", help="Show detailed output messages")
+    # index command
+    index_parser = subparsers.add_parser("index", help="Build or refresh the subtitle index database.", parents=[common])
+    index_parser.add_argument("-l", "--language", required=True, help="Path to language subs folder")
+    index_parser.add_argument("-j", "--japanese", required=True, help="Path to Japanese subs folder")
+    index_parser.add_argument("-d", "--database", default="ff16_subtitles.db", help="Index database file")
+    index_parser.add_argument("--jobs", type=int, default=1, help="Number of processes used to read XML files (default: 1)")
+    index_parser.add_argument("-v", "--verbose", action="store_true", help="Show detailed output messages")
+    # query command
+    query_parser = subparsers.add_parser("query", help="Search subtitle lines in the index database.", parents=[common])
+    query_parser.add_argument("-d", "--database", default="ff16_subtitles.db", help="Index database file")
+    query_parser.add_argument("--id", help="TextContent ID")
+    query_parser.add_argument("--character", help="Character ID (e.g. 100300)")
+    query_parser.add_argument("--subtype", help="Subtitle type (Normal, SFX, Hidden)")
+    query_parser.add_argument("--folder", help="Folder name (e.g. bevent)")
+    query_parser.add_argument("--file", help="Filename without extension")
+    query_parser.add_argument("--text", help="Text contained in the original or Japanese message")
+    query_parser.add_argument("--limit", type=int, help="Maximum number of lines to show")
+    query_parser.add_argument("-v", "--verbose", action="store_true", help="Show Japanese text too")
+    # watch command
+    watch_parser = subparsers.add_parser("watch", help="Apply XLSX changes and convert changed XML files as they are saved.", parents=[common])
+    watch_parser.add_argument("-f", "--file", required=True, help="XLSX file path")
+    watch_parser.add_argument("-col", required=True, help="Column with new translations (e.g. I2)")
+    watch_parser.add_argument("-l", "--language", required=True, help="Path to language to translate folder")
+    watch_parser.add_argument("-c", "--converter", help="Path to FF16Converter.exe, changed XML files are converted to PZD when set")
+    watch_parser.add_argument("--interval", type=float, default=1.0, help="Seconds between checks (default: 1)")
+    watch_parser.add_argument("--debounce", type=float, default=2.0, help="Seconds a file must stay unchanged before it is processed (default: 2)")
+    watch_parser.add_argument("--jobs", type=int, default=1, help="Number of FF16Converter processes to run at once (default: 1)")
+    watch_parser.add_argument("-v", "--verbose", action="store_true", help="Show detailed output messages")
+    # validate command
+    validate_parser = subparsers.add_parser("validate", help="Check IDs and markup of language, Japanese and XLSX files.", parents=[common])
+    validate_parser.add_argument("-l", "--language", required=True, help="Path to language subs folder")
+    validate_parser.add_argument("-j", "--japanese", required=True, help="Path to Japanese subs folder")
+    validate_parser.add_argument("-f", "--file", help="XLSX file path, its translations are checked too")
+    validate_parser.add_argument("-col", default="I2", help="Column with new translations (default: I2)")
+    validate_parser.add_argument("--jobs", type=int, default=1, help="Number of processes used to read XML files (default: 1)")
+    validate_parser.add_argument("-v", "--verbose", action="store_true", help="Show detailed output messages")
 
     args = parser.parse_args()
-
-    if args.command == "to-xlsx":
-        print(f"> Exporting to XLSX: \033[48;5;235m{args.output}\033[00m")
-        table_rows = collect_table(args.language, args.japanese)
-        export_xlsx(table_rows, args.output, args.verbose)
-    elif args.command == "edit-xml":
-        print(f"> Applying translations from: \033[48;5;235m{args.file}\033[00m")
-        edit_xml(args.file, args.col, args.language, args.verbose)
-    elif args.command == "convert-batch":
-        convert_batch(args.converter,args.folder,args.extension, args.verbose)
-        if args.moveto and args.extension:
-            move_converted(args.folder, args.moveto, args.extension, args.verbose)
-    elif args.command == "move-batch":
-        move_converted(args.folder, args.moveto, args.extension, args.verbose)
+    if args.command == "to-xlsx" and not (args.language and args.japanese) and not args.index:
+        xlsx_parser.error("the following arguments are required: -l/--language, -j/--japanese")
+    if args.command == "to-xlsx" and args.language and len(args.language) > 1 and (args.index or not args.japanese):
+        xlsx_parser.error("several -l/--language need -j/--japanese and can't be used with --index")
+    profiler = None
+    if args.profile is not None:
+        import cProfile
+        profiler = cProfile.Profile(); profiler.enable()
+    start_time = perf_counter(); status = 0
+    try:
+        status = run_command(args)
+    finally:
+        if profiler:
+            profiler.disable()
+            if args.profile:
+                profiler.dump_stats(args.profile)
+                print(f" \033[38;5;75m[INFO]\033[00m Profile saved in: \033[48;5;235m{args.profile}\033[00m")
+            else:
+                import pstats
+                pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+        if args.stats_json:
+            write_stats(args.stats_json, args.command, perf_counter() - start_time)
+    if status:
+        raise SystemExit(status)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,59 @@
+import os, sys, tempfile, tracemalloc, argparse
+from time import perf_counter
+import xml.etree.ElementTree as ET
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from FF16SubsOrganizer import read_texts
+
+def read_texts_fromstring(xml_path):
+    with open(xml_path, "r", encoding="utf-8") as f:
+        content = f.read()
+    root = ET.fromstring(content)
+    text_contents = root.find("TextContents")
+    if text_contents is None:
+        return []
+    result = []
+    for text_content in text_contents.findall("TextContent"):
+        content_id = text_content.get("ID", "")
+        message = text_content.findtext("Message", default="").strip()
+        chara_id = text_content.get("Unknown2", "")
+        subtype = text_content.get("Unknown3", "")
+        result.append((content_id, chara_id, subtype, message))
+    return result
+
+def write_synthetic(path, lines):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write('<?xml version="1.0" encoding="utf-16"?>\r\n<PzdFile xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns:xsd="http://www.w3.org/2001/XMLSchema">\r\n  <TextContents>\r\n')
+        for i in range(lines):
+            f.write(f'    <TextContent ID="{i + 1}" Unknown2="100100" Unknown3="{i % 3}">\r\n      <Message>Line {i}, long enough to look like real dialogue &amp; more.&lt;br&gt;\r\nSecond line.</Message>\r\n      <Voice />\r\n      <String />\r\n    </TextContent>\r\n')
+        f.write('  </TextContents>\r\n</PzdFile>')
+
+def measure(reader, path, repeat):
+    best = None
+    for _ in range(repeat):
+        start = perf_counter(); result = reader(path); lapsed = perf_counter() - start
+        best = lapsed if best is None else min(best, lapsed)
+    tracemalloc.start()
+    reader(path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, best, peak
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the streaming XML reader against the read-whole-file reader.")
+    parser.add_argument("--lines", type=int, default=10000, help="TextContent entries in the synthetic file")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions, best one is reported")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "synthetic.pzd.xml")
+        write_synthetic(path, args.lines)
+        print(f"> {args.lines} lines, {os.path.getsize(path) / 1024:.0f} KiB")
+        old_rows, old_time, old_peak = measure(read_texts_fromstring, path, args.repeat)
+        new_rows, new_time, new_peak = measure(read_texts, path, args.repeat)
+    if old_rows != new_rows:
+        print(" [ERROR] Readers returned different rows")
+        sys.exit(1)
+    print(f"   fromstring: {old_time * 1000:8.1f} ms, peak {old_peak / 1048576:6.1f} MiB")
+    print(f"   iterparse:  {new_time * 1000:8.1f} ms, peak {new_peak / 1048576:6.1f} MiB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import os, sys, tempfile, argparse, subprocess, statistics
+from time import perf_counter
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+import FF16SubsOrganizer as organizer
+
+SCRIPT = os.path.join(REPO_ROOT, "FF16SubsOrganizer.py")
+
+def time_subprocess(command, repeat):
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(perf_counter() - start)
+    return statistics.median(times)
+
+def time_call(function, repeat, setup=None):
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = perf_counter(); function(); times.append(perf_counter() - start)
+    return statistics.median(times)
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure FF16SubsOrganizer startup and ID table loading times.")
+    parser.add_argument("--repeat", type=int, default=10, help="Repetitions, the median is reported")
+    args = parser.parse_args()
+    cache_path = os.path.join(organizer.SCRIPT_DIR, "__pycache__", "IDs.json.marshal")
+    def drop_cache():
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+    print(f"> Median of {args.repeat} runs")
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "source"); os.makedirs(source)
+        print(f"   python -c pass:          {time_subprocess([sys.executable, '-c', 'pass'], args.repeat) * 1000:8.1f} ms")
+        print(f"   --help:                  {time_subprocess([sys.executable, SCRIPT, '--help'], args.repeat) * 1000:8.1f} ms")
+        print(f"   move-batch (empty):      {time_subprocess([sys.executable, SCRIPT, 'move-batch', '-f', source, '--xml', '-m', os.path.join(tmp, 'moved')], args.repeat) * 1000:8.1f} ms")
+    print(f"   IDs.json without cache:  {time_call(organizer.load_ids, args.repeat, drop_cache) * 1000:8.2f} ms")
+    print(f"   IDs.json from cache:     {time_call(organizer.load_ids, args.repeat) * 1000:8.2f} ms")
+    organizer.get_ids()
+    print(f"   get_ids memoized:        {time_call(organizer.get_ids, args.repeat) * 1000:8.4f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import os, sys, json, random, argparse
+from html import escape
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FOLDERS = ["bevent", "bossbattle", "defaultq", "simpleq"]
+WORDS = ["the", "Clive", "Joshua", "Jill", "crystal", "Mothercrystal", "Dominant", "Bearer", "Rosaria", "Sanbreque", "Eikon", "fire", "hideaway", "Cid", "sword", "must", "we", "never", "again", "forward", "stand"]
+
+def sentence(rng, jap=False):
+    text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 18))) + "."
+    text = text[0].upper() + text[1:]
+    if jap:
+        text = "".join(chr(0x3041 + rng.randint(0, 80)) for _ in range(len(text) // 2)) + "。"
+    if rng.random() < 0.3:
+        text += "<br>\r\n" + sentence(rng, jap)
+    return text
+
+def write_pzd_xml(path, entries):
+    parts = ['<?xml version="1.0" encoding="utf-16"?>\r\n<PzdFile xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns:xsd="http://www.w3.org/2001/XMLSchema">\r\n  <TextContents>\r\n']
+    for msg_id, chara_id, subtype, message in entries:
+        parts.append(f'    <TextContent ID="{msg_id}" Unknown2="{chara_id}" Unknown3="{subtype}">\r\n      <Message>{escape(message, quote=False)}</Message>\r\n      <Voice />\r\n      <String />\r\n    </TextContent>\r\n')
+    parts.append("  </TextContents>\r\n</PzdFile>")
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write("".join(parts))
+
+def generate_tree(root, files=20, lines=200, folders=FOLDERS, seed=16):
+    with open(os.path.join(REPO_ROOT, "IDs.json"), "r", encoding="utf-8") as f:
+        ids = json.load(f)
+    characters = list(ids["characters"]); subtypes = list(ids["subtitleID"])
+    rng = random.Random(seed)
+    lang_root = os.path.join(root, "0007.en", "nxd", "text")
+    jap_root = os.path.join(root, "0007.ja", "nxd", "text")
+    for folder in folders:
+        os.makedirs(os.path.join(lang_root, folder), exist_ok=True)
+        os.makedirs(os.path.join(jap_root, folder), exist_ok=True)
+        for number in range(files):
+            entries = []
+            for msg_id in rng.sample(range(1, lines * 10), lines):
+                entries.append((msg_id, rng.choice(characters), rng.choice(subtypes), sentence(rng)))
+            filename = f"{folder}_{number:04d}.pzd.xml"
+            write_pzd_xml(os.path.join(lang_root, folder, filename), entries)
+            write_pzd_xml(os.path.join(jap_root, folder, filename), [(msg_id, chara_id, subtype, sentence(rng, True)) for msg_id, chara_id, subtype, _ in entries])
+    return lang_root, jap_root
+
+def generate_edited_xlsx(lang_root, jap_root, output, ratio=0.1, seed=16):
+    from openpyxl import Workbook
+    sys.path.insert(0, REPO_ROOT)
+    from FF16SubsOrganizer import collect_table, SHEET_HEADER, sheet_title
+    rng = random.Random(seed)
+    table_rows = collect_table(lang_root, jap_root)
+    wb = Workbook(write_only=True)
+    wb.create_sheet(title="STATS").append(["FFXVI Subtitle Translation Progress Sheet"])
+    sheets = {}
+    for row in table_rows:
+        if row[0] not in sheets:
+            sheets[row[0]] = wb.create_sheet(title=sheet_title(row[0]))
+            sheets[row[0]].append(SHEET_HEADER)
+        translation = f"{row[6]} (retranslated)" if rng.random() < ratio else None
+        sheets[row[0]].append(list(row) + [translation])
+    wb.save(output)
+    return len(table_rows)
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic FF16 nxd/text tree pair and an edited XLSX.")
+    parser.add_argument("-o", "--output", required=True, help="Folder where 0007.en and 0007.ja are created")
+    parser.add_argument("--files", type=int, default=20, help="Files per folder")
+    parser.add_argument("--lines", type=int, default=200, help="TextContent entries per file")
+    parser.add_argument("--folders", nargs="+", default=FOLDERS, help="Folders to create")
+    parser.add_argument("--edit-ratio", type=float, default=0.1, help="Fraction of rows with a retranslation in the XLSX")
+    parser.add_argument("--seed", type=int, default=16, help="Random seed")
+    args = parser.parse_args()
+    lang_root, jap_root = generate_tree(args.output, args.files, args.lines, args.folders, args.seed)
+    rows = generate_edited_xlsx(lang_root, jap_root, os.path.join(args.output, "edited.xlsx"), args.edit_ratio, args.seed)
+    print(f"> Generated {len(args.folders) * args.files} file pairs, {rows} lines in: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import os, sys, json, pickle, shutil, tempfile, argparse, subprocess, platform
+from contextlib import redirect_stdout
+from time import perf_counter
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+STEPS = ["collect_table", "export_xlsx", "export_xlsx_stream", "edit_xml", "convert_batch", "move_converted", "validate_trees"]
+
+def stub_converter(folder):
+    stub = os.path.join(BENCH_DIR, "stub_converter.py")
+    if os.name == "nt":
+        path = os.path.join(folder, "FF16Converter.bat")
+        with open(path, "w") as f:
+            f.write(f'@"{sys.executable}" "{stub}" %*\n')
+    else:
+        path = os.path.join(folder, "FF16Converter")
+        with open(path, "w") as f:
+            f.write(f'#!/bin/sh\nexec "{sys.executable}" "{stub}" "$@"\n')
+        os.chmod(path, 0o755)
+    return path
+
+def tree_roots(tree):
+    return os.path.join(tree, "0007.en", "nxd", "text"), os.path.join(tree, "0007.ja", "nxd", "text")
+
+def prepare_step(step, tree, scratch):
+    sys.path.insert(0, REPO_ROOT)
+    import FF16SubsOrganizer as organizer
+    lang_root, jap_root = tree_roots(tree)
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        if step in ("export_xlsx", "export_xlsx_stream"):
+            with open(os.path.join(scratch, "rows.pickle"), "wb") as f:
+                pickle.dump(organizer.collect_table(lang_root, jap_root), f)
+        elif step in ("edit_xml", "convert_batch", "move_converted"):
+            shutil.copytree(lang_root, os.path.join(scratch, "text"))
+        if step in ("convert_batch", "move_converted"):
+            converter = stub_converter(scratch)
+            if step == "move_converted":
+                organizer.convert_batch(converter, os.path.join(scratch, "text"), ".xml", False)
+
+def run_step(step, tree, scratch):
+    sys.path.insert(0, REPO_ROOT)
+    import FF16SubsOrganizer as organizer
+    lang_root, jap_root = tree_roots(tree)
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        if step == "collect_table":
+            timed = lambda: organizer.collect_table(lang_root, jap_root)
+        elif step in ("export_xlsx", "export_xlsx_stream"):
+            with open(os.path.join(scratch, "rows.pickle"), "rb") as f:
+                table_rows = pickle.load(f)
+            export = getattr(organizer, step)
+            timed = lambda: export(table_rows, os.path.join(scratch, "export.xlsx"), False)
+        elif step == "edit_xml":
+            timed = lambda: organizer.edit_xml(os.path.join(tree, "edited.xlsx"), "I2", os.path.join(scratch, "text"), False)
+        elif step == "convert_batch":
+            converter = os.path.join(scratch, "FF16Converter.bat" if os.name == "nt" else "FF16Converter")
+            timed = lambda: organizer.convert_batch(converter, os.path.join(scratch, "text"), ".xml", False)
+        elif step == "move_converted":
+            timed = lambda: organizer.move_converted(os.path.join(scratch, "text"), os.path.join(scratch, "moved"), ".xml", False)
+        elif step == "validate_trees":
+            timed = lambda: organizer.validate_trees(lang_root, jap_root, os.path.join(tree, "edited.xlsx"))
+        setup_rss = organizer.peak_rss()
+        start = perf_counter(); timed(); wall = perf_counter() - start
+    return {"wall": round(wall, 4), "peak_rss": organizer.peak_rss(), "setup_rss": setup_rss}
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+def compare(old_path, results):
+    with open(old_path, "r", encoding="utf-8") as f:
+        old = json.load(f)
+    print(f"> Compared with {old.get('commit')} ({old_path})")
+    for step, result in results.items():
+        before = old.get("results", {}).get(step)
+        if not before:
+            continue
+        ratio = result["wall"] / before["wall"] if before["wall"] else 0
+        print(f"   {step:<20} {before['wall']:8.3f} s -> {result['wall']:8.3f} s  x{ratio:5.2f}   {before['peak_rss'] / 1048576:7.1f} MiB -> {result['peak_rss'] / 1048576:7.1f} MiB")
+
+def main():
+    parser = argparse.ArgumentParser(description="Time every FF16SubsOrganizer step on a synthetic tree.")
+    parser.add_argument("--files", type=int, default=20, help="Files per folder")
+    parser.add_argument("--lines", type=int, default=200, help="TextContent entries per file")
+    parser.add_argument("--steps", nargs="+", choices=STEPS, default=STEPS, help="Steps to run")
+    parser.add_argument("--tree", help="Reuse an existing tree made with generate.py instead of a temporary one")
+    parser.add_argument("-o", "--output", default="bench_results.json", help="Results JSON file")
+    parser.add_argument("--compare", help="Previous results JSON file to compare with")
+    parser.add_argument("--step", help=argparse.SUPPRESS)
+    parser.add_argument("--scratch", help=argparse.SUPPRESS)
+    parser.add_argument("--prepare", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.step and args.prepare:
+        prepare_step(args.step, args.tree, args.scratch)
+        return
+    if args.step:
+        print(json.dumps(run_step(args.step, args.tree, args.scratch)))
+        return
+    tree = args.tree or tempfile.mkdtemp(prefix="ff16bench_tree_")
+    try:
+        if not args.tree:
+            subprocess.run([sys.executable, os.path.join(BENCH_DIR, "generate.py"), "-o", tree, "--files", str(args.files), "--lines", str(args.lines)], check=True, capture_output=True)
+        results = {}
+        for step in args.steps:
+            scratch = tempfile.mkdtemp(prefix=f"ff16bench_{step}_")
+            try:
+                command = [sys.executable, os.path.abspath(__file__), "--step", step, "--tree", tree, "--scratch", scratch]
+                output = subprocess.run(command + ["--prepare"], capture_output=True, text=True)
+                if output.returncode == 0:
+                    output = subprocess.run(command, capture_output=True, text=True)
+            finally:
+                shutil.rmtree(scratch, ignore_errors=True)
+            if output.returncode != 0:
+                print(f" [ERROR] {step} failed:\n{output.stderr}")
+                continue
+            results[step] = json.loads(output.stdout.strip().splitlines()[-1])
+            print(f"   {step:<20} {results[step]['wall']:8.3f} s   {results[step]['peak_rss'] / 1048576:7.1f} MiB")
+    finally:
+        if not args.tree:
+            shutil.rmtree(tree, ignore_errors=True)
+    report = {"commit": git_commit(), "python": platform.python_version(), "platform": platform.platform(), "files": args.files, "lines": args.lines, "results": results}
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"> Results written to: {args.output}")
+    if args.compare:
+        compare(args.compare, results)
+
+if __name__ == "__main__":
+    main()
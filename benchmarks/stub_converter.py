@@ -0,0 +1,18 @@
+import os, sys
+
+# Stand-in for FF16Converter.exe: writes the file the real converter would
+# produce next to every input, without touching the input itself.
+def main():
+    for path in sys.argv[1:]:
+        if path.lower().endswith(".pzd"):
+            output = path + ".xml"
+        elif path.lower().endswith(".xml"):
+            output = path + "RB.pzd"
+        else:
+            print(f"Unsupported file: {path}", file=sys.stderr)
+            continue
+        with open(path, "rb") as f, open(output, "wb") as out:
+            out.write(f.read())
+
+if __name__ == "__main__":
+    main()